@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+剪貼簿存取
+
+直接呼叫作業系統 API 讀寫剪貼簿，避免 pyperclip 每次都啟動
+pbcopy / pbpaste / clip.exe 等子程序：
+  - macOS：AppKit.NSPasteboard（需要 pyobjc-framework-Cocoa）
+  - Windows：透過 ctypes 呼叫 user32 / kernel32
+  - 其他平台或缺少套件時：退回使用 pyperclip
+"""
+
+import sys
+import time
+
+import pyperclip
+
+_HAVE_APPKIT = False
+_HAVE_WIN32 = False
+
+if sys.platform == 'darwin':
+    try:
+        from AppKit import NSPasteboard, NSPasteboardTypeString
+        _HAVE_APPKIT = True
+    except Exception:
+        NSPasteboard = None
+        NSPasteboardTypeString = None
+elif sys.platform == 'win32':
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        _user32 = ctypes.WinDLL('user32', use_last_error=True)
+        _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+
+        _user32.OpenClipboard.argtypes = [wintypes.HWND]
+        _user32.OpenClipboard.restype = wintypes.BOOL
+        _user32.CloseClipboard.argtypes = []
+        _user32.CloseClipboard.restype = wintypes.BOOL
+        _user32.EmptyClipboard.argtypes = []
+        _user32.EmptyClipboard.restype = wintypes.BOOL
+        _user32.GetClipboardData.argtypes = [wintypes.UINT]
+        _user32.GetClipboardData.restype = wintypes.HANDLE
+        _user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+        _user32.SetClipboardData.restype = wintypes.HANDLE
+        _user32.CreateWindowExW.argtypes = [
+            wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+            ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+            wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID,
+        ]
+        _user32.CreateWindowExW.restype = wintypes.HWND
+        _user32.DestroyWindow.argtypes = [wintypes.HWND]
+        _user32.DestroyWindow.restype = wintypes.BOOL
+        _kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+        _kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+        _kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+        _kernel32.GlobalLock.restype = wintypes.LPVOID
+        _kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+        _kernel32.GlobalUnlock.restype = wintypes.BOOL
+        _kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+        _kernel32.GlobalFree.restype = wintypes.HGLOBAL
+        _HAVE_WIN32 = True
+    except Exception:
+        pass
+
+# Windows 剪貼簿格式與記憶體配置旗標
+_CF_UNICODETEXT = 13
+_GMEM_MOVEABLE = 0x0002
+
+
+def _win_open_clipboard(hwnd=None, retries=10, delay=0.01):
+    """開啟 Windows 剪貼簿；其他程式佔用時稍等後重試"""
+    for _ in range(retries):
+        if _user32.OpenClipboard(hwnd):
+            return
+        time.sleep(delay)
+    raise ctypes.WinError(ctypes.get_last_error())
+
+
+def _win_copy(text):
+    data = text.encode('utf-16-le') + b'\x00\x00'
+    # 以 NULL hwnd 開啟時 EmptyClipboard 會把擁有者設為 NULL，導致 SetClipboardData 失敗，
+    # 因此建立一個隱藏的 STATIC 視窗作為剪貼簿擁有者（與 pyperclip 的做法相同）
+    hwnd = _user32.CreateWindowExW(0, 'STATIC', None, 0, 0, 0, 0, 0, None, None, None, None)
+    if not hwnd:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        _win_open_clipboard(hwnd)
+        try:
+            _user32.EmptyClipboard()
+            handle = _kernel32.GlobalAlloc(_GMEM_MOVEABLE, len(data))
+            if not handle:
+                raise ctypes.WinError(ctypes.get_last_error())
+            ptr = _kernel32.GlobalLock(handle)
+            if not ptr:
+                error = ctypes.WinError(ctypes.get_last_error())
+                _kernel32.GlobalFree(handle)
+                raise error
+            ctypes.memmove(ptr, data, len(data))
+            _kernel32.GlobalUnlock(handle)
+            # 設定成功後記憶體由系統接管，失敗時才需要自行釋放
+            if not _user32.SetClipboardData(_CF_UNICODETEXT, handle):
+                error = ctypes.WinError(ctypes.get_last_error())
+                _kernel32.GlobalFree(handle)
+                raise error
+        finally:
+            _user32.CloseClipboard()
+    finally:
+        _user32.DestroyWindow(hwnd)
+
+
+def _win_paste():
+    _win_open_clipboard()
+    try:
+        handle = _user32.GetClipboardData(_CF_UNICODETEXT)
+        if not handle:
+            return ''
+        ptr = _kernel32.GlobalLock(handle)
+        if not ptr:
+            return ''
+        try:
+            return ctypes.wstring_at(ptr)
+        finally:
+            _kernel32.GlobalUnlock(handle)
+    finally:
+        _user32.CloseClipboard()
+
+
+def copy(text):
+    """
+    將文字寫入剪貼簿
+
+    Args:
+        text: 要寫入的文字
+    """
+    if _HAVE_APPKIT:
+        pb = NSPasteboard.generalPasteboard()
+        pb.clearContents()
+        pb.setString_forType_(text, NSPasteboardTypeString)
+    elif _HAVE_WIN32:
+        _win_copy(text)
+    else:
+        pyperclip.copy(text)
+
+
+def paste():
+    """
+    讀取剪貼簿中的文字
+
+    Returns:
+        剪貼簿文字（沒有文字內容時為空字串）
+    """
+    if _HAVE_APPKIT:
+        return NSPasteboard.generalPasteboard().stringForType_(NSPasteboardTypeString) or ''
+    if _HAVE_WIN32:
+        return _win_paste()
+    return pyperclip.paste()
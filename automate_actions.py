@@ -4,69 +4,203 @@
 滑鼠鍵盤自動化腳本
 
 使用說明：
-  python3 automate_actions.py
+  python3 automate_actions.py [-v]
   
-  執行預設的自動化操作序列
+  執行預設的自動化操作序列，加上 -v 會顯示每個滑鼠/鍵盤操作
 """
 
+import os
 import time
+import logging
+import argparse
 import platform
-import pyperclip
+import threading
+import traceback
 import subprocess
 from pathlib import Path
 from pynput import mouse, keyboard
 from pynput.mouse import Button
 from pynput.keyboard import Key, Listener as KeyboardListener
 
+import _clipboard
+
+try:
+    # 與本腳本位於同一專案，可直接在目前程序中呼叫，不必另開 python3 子程序
+    import parse_questions
+except ImportError:
+    parse_questions = None
+
+log = logging.getLogger(__name__)
+
+# Windows 的 ESC 虛擬鍵碼
+_VK_ESCAPE = 0x1B
+# 搜尋並選擇單元時貼上的文字，例如 "01. " "02. " "03. " "04. " ...
+_UNIT_SEARCH = "01. "
+# 交卷後在 console 執行，將題目表格的 HTML 複製到剪貼簿（copy() 為 DevTools console 內建函式）
+_COPY_TBODY_JS = "copy(document.querySelector('tbody').outerHTML)"
+# 在 console 貼上執行的作答腳本
+_JS_PAYLOAD = """const yourAnswers = [
+    1, 3, 2, 4, 1, 3, 2, 4, 1, 3, // 第 1 到 10 題
+    2, 4, 1, 3, 2, 4, 1, 3, 2, 4, // 第 11 到 20 題
+    1, 3, 2, 4, 1, 3, 2, 4, 1, 3, // 第 21 到 30 題
+    2, 4, 1, 3, 2, 4, 1, 3, 2, 4, // 第 31 到 40 題
+    1, 3, 2, 4, 1, 3, 2, 4, 1, 3, // 第 41 到 50 題
+    2, 4, 1, 3, 2, 4, 1, 3,        // 第 51 到 58 題
+    2, 4, 1, 3, 2, 4             // 第 59 到 64 題
+];
+
+const allQuestionContainers = document.querySelectorAll('.body');
+
+if (allQuestionContainers.length < yourAnswers.length) {
+    console.error(`❌ 錯誤：答案數量 (${yourAnswers.length}) 多於頁面上的題目數量 (${allQuestionContainers.length})。`);
+}
+
+yourAnswers.forEach((answerValue, index) => {
+    const questionIndex = index + 1; // 題目從 1 開始
+    const container = allQuestionContainers[index];
+
+    if (!container) {
+        console.warn(`⚠️ 警告：找不到第 ${questionIndex} 題的容器。`);
+        return;
+    }
+
+    const targetRadio = container.querySelector(`input[type="radio"][value="${answerValue}"]`);
+
+    if (targetRadio) {
+        targetRadio.checked = true;
+        console.log(`✅ 第 ${questionIndex} 題成功選取選項 (${answerValue})。`);
+    } else {
+        console.warn(`⚠️ 警告：第 ${questionIndex} 題找不到對應選項 (${answerValue})。`);
+    }
+});"""
+
+
+# ========== 自動化操作序列 ==========
+# 每一步為 (操作類型, 參數...)：
+#   ('click', x, y, 等待秒數)      點擊座標
+#   ('combo', 按鍵, 等待秒數)      按下 Ctrl/Cmd + 按鍵
+#   ('paste', 文字, 等待秒數)      將文字貼上
+#   ('key', 按鍵, 等待秒數)        按下單一按鍵
+#   ('save', 檔案路徑)             將剪貼簿內容儲存為檔案
+#   ('run', 腳本路徑)              執行 Python 腳本
+AUTOMATION_SCRIPT = [
+    # 點擊位置 1 參賽按鈕
+    # TODO: 請填入座標 (x, y)
+    ('click', 100, 175, 0.5),
+    # 點擊位置 2 模擬取卷練習
+    # TODO: 請填入座標 (x, y)
+    ('click', 300, 750, 0.5),
+    # 點擊位置 8 空點
+    # TODO: 請填入座標 (x, y)
+    ('click', 1100, 400, 0.5),
+    # 按 Ctrl+F (Mac: Cmd+F) 搜尋
+    ('combo', 'f', 0.5),
+    # 按 Ctrl+V (Mac: Cmd+V) 貼上 "01. " 選擇單元
+    ('paste', _UNIT_SEARCH, 0.5),
+    # 點擊位置 3 播放影片
+    # TODO: 請填入座標 (x, y)
+    ('click', 800, 800, 0.5),
+    # 點擊位置 4 關閉影片
+    # TODO: 請填入座標 (x, y)
+    ('click', 1010, 20, 0.5),
+    # 點擊位置 5 打開console
+    # TODO: 請填入座標 (x, y)
+    ('click', 1240, 200, 0.5),
+    # 按 Ctrl+V (Mac: Cmd+V) 貼上作答腳本
+    ('paste', _JS_PAYLOAD, 0.5),
+    # 按下 Enter
+    ('key', Key.enter, 1),
+    # 點擊位置 6 交卷
+    # TODO: 請填入座標 (x, y)
+    ('click', 980, 650, 1),
+    # 點擊位置 5 回到console
+    # TODO: 請填入座標 (x, y)
+    ('click', 1240, 200, 0.5),
+    # 按 Ctrl+V (Mac: Cmd+V) 貼上複製題目表格的指令
+    ('paste', _COPY_TBODY_JS, 0),
+    # 按下 Enter 執行，題目表格 HTML 會被複製到剪貼簿
+    ('key', Key.enter, 0.5),
+    # 將剪貼簿內容儲存為 questions.html
+    ('save', 'questions.html'),
+    # 執行 parse_questions.py
+    ('run', 'parse_questions.py'),
+]
+# ====================================
+
+
+def _esc_only_win32_filter(msg, data):
+    """Windows 鍵盤事件過濾器：非 ESC 的按鍵回傳 False，監聽器就不會分派給 on_press 回呼"""
+    return data.vkCode == _VK_ESCAPE
+
 
 class ActionAutomator:
     """滑鼠鍵盤自動化執行器"""
     
-    def __init__(self, action_interval=0.5):
+    # 根據作業系統設定修飾鍵（Mac 使用 Cmd，Windows 使用 Ctrl），只在載入時判斷一次
+    _IS_MAC = platform.system() == 'Darwin'
+    _MODIFIER_NAME = 'Cmd' if _IS_MAC else 'Ctrl'
+    _MODIFIER_KEY = Key.cmd if _IS_MAC else Key.ctrl
+    
+    def __init__(self, action_interval=0.5, move_settle=0.0, esc_checks=True):
         """
         初始化自動化執行器
         
         Args:
             action_interval: 每個操作之間的間隔時間（秒）
+            move_settle: 滑鼠移動到位置後、點擊前的等待時間（秒），0 表示不等待
+            esc_checks: 是否在操作序列的每個步驟之間檢查 ESC 並立即返回；
+                        False 時只依賴各操作本身的檢查（停止後其餘操作會直接略過）
         """
         self.action_interval = action_interval
+        self.move_settle = move_settle
+        self._esc_checks = esc_checks
         self.mouse_controller = mouse.Controller()
         self.keyboard_controller = keyboard.Controller()
-        self.is_mac = platform.system() == 'Darwin'
-        self.should_stop = False
-        self.keyboard_listener = None
-        
-        # 根據作業系統設定修飾鍵
-        if self.is_mac:
-            self.modifier_key = Key.cmd  # Mac 使用 Cmd
-        else:
-            self.modifier_key = Key.ctrl  # Windows 使用 Ctrl
+        # 預先綁定常用的控制器方法，省去每次操作的屬性查找
+        self._m = self.mouse_controller
+        self._kb = self.keyboard_controller
+        self._m_click = self._m.click
+        self._kb_press = self._kb.press
+        self._kb_release = self._kb.release
+        # ESC 停止旗標：由背景執行緒設定，等待中的 wait() 會立即返回
+        self._stop_event = threading.Event()
+        self._esc_listener = None
+        # 最後一次寫入剪貼簿的內容，內容相同時不再重複寫入
+        self._last_clip = None
     
-    def on_key_press(self, key):
-        """監聽鍵盤按鍵，ESC 鍵立即停止"""
+    def start_esc_watcher(self):
+        """啟動 ESC 鍵監聽器（若已在執行則不重複啟動）"""
+        if self._esc_listener is not None and self._esc_listener.is_alive():
+            return
+        self._stop_event.clear()
+        # 不攔截任何按鍵；Windows 上只有 ESC 會進入 Python 回呼
+        self._esc_listener = KeyboardListener(
+            on_press=self._on_esc_press,
+            suppress=False,
+            win32_event_filter=_esc_only_win32_filter
+        )
+        self._esc_listener.start()
+    
+    def _on_esc_press(self, key):
+        """收到 ESC 鍵時設定停止旗標並結束監聽"""
         if key == Key.esc:
             print("\n\n偵測到 ESC 鍵，立即停止執行...")
-            self.should_stop = True
+            self._stop_event.set()
             return False  # 停止監聽器
     
     def wait(self, seconds=None):
         """
         等待指定時間，如果未指定則使用預設間隔
-        在等待過程中會持續檢測 ESC 鍵
+        按下 ESC 鍵時會立即結束等待
         
         Args:
             seconds: 等待時間（秒），如果為 None 則使用預設間隔
+        
+        Returns:
+            是否因按下 ESC 鍵而提前結束
         """
         wait_time = seconds if seconds is not None else self.action_interval
-        # 將等待時間分成小段，每段檢查是否應該停止
-        step = 0.1  # 每 0.1 秒檢查一次
-        elapsed = 0
-        while elapsed < wait_time:
-            if self.should_stop:
-                return
-            sleep_time = min(step, wait_time - elapsed)
-            time.sleep(sleep_time)
-            elapsed += sleep_time
+        return self._stop_event.wait(wait_time)
     
     def click(self, x, y, button=Button.left, interval=None):
         """
@@ -78,14 +212,15 @@ class ActionAutomator:
             button: 滑鼠按鍵（預設左鍵）
             interval: 操作後的等待時間（秒），如果為 None 則使用預設間隔
         """
-        if self.should_stop:
-            return
-        self.mouse_controller.position = (x, y)
-        self.wait(0.1)  # 移動到位置後稍等一下
-        if self.should_stop:
+        if self._stop_event.is_set():
             return
-        self.mouse_controller.click(button)
-        print(f"點擊: ({x}, {y})")
+        self._m.position = (x, y)
+        if self.move_settle > 0:
+            self.wait(self.move_settle)  # 移動到位置後稍等一下
+            if self._stop_event.is_set():
+                return
+        self._m_click(button)
+        log.debug("點擊: (%s, %s)", x, y)
         self.wait(interval)
     
     def press_key_combination(self, modifier, key, interval=None):
@@ -97,14 +232,16 @@ class ActionAutomator:
             key: 主要按鍵（可以是字符串或 Key 對象）
             interval: 操作後的等待時間（秒），如果為 None 則使用預設間隔
         """
-        if self.should_stop:
+        if self._stop_event.is_set():
             return
-        with self.keyboard_controller.pressed(modifier):
-            self.keyboard_controller.press(key)
-            self.keyboard_controller.release(key)
-        key_name = key if isinstance(key, str) else str(key).replace('Key.', '')
-        modifier_name = 'Cmd' if self.is_mac else 'Ctrl'
-        print(f"按下: {modifier_name} + {key_name}")
+        # 依序按下、放開，確保修飾鍵不會殘留在按下狀態
+        self._kb_press(modifier)
+        self._kb_press(key)
+        self._kb_release(key)
+        self._kb_release(modifier)
+        if log.isEnabledFor(logging.DEBUG):
+            key_name = key if isinstance(key, str) else str(key).replace('Key.', '')
+            log.debug("按下: %s + %s", self._MODIFIER_NAME, key_name)
         self.wait(interval)
     
     def type_text(self, text, interval=None):
@@ -115,10 +252,10 @@ class ActionAutomator:
             text: 要輸入的文字
             interval: 操作後的等待時間（秒），如果為 None 則使用預設間隔
         """
-        if self.should_stop:
+        if self._stop_event.is_set():
             return
-        self.keyboard_controller.type(text)
-        print(f"輸入: {text}")
+        self._kb.type(text)
+        log.debug("輸入: %s", text)
         self.wait(interval)
     
     def paste_text(self, text, interval=None):
@@ -129,11 +266,13 @@ class ActionAutomator:
             text: 要貼上的文字
             interval: 操作後的等待時間（秒），如果為 None 則使用預設間隔
         """
-        if self.should_stop:
+        if self._stop_event.is_set():
             return
-        pyperclip.copy(text)
-        self.press_key_combination(self.modifier_key, 'v', interval=0)  # 貼上後不等待，由外部控制
-        print(f"貼上文字（長度: {len(text)} 字元）")
+        if text != self._last_clip:
+            _clipboard.copy(text)
+            self._last_clip = text
+        self.press_key_combination(self._MODIFIER_KEY, 'v', interval=0)  # 貼上後不等待，由外部控制
+        log.debug("貼上文字（長度: %d 字元）", len(text))
         self.wait(interval)
     
     def press_key(self, key, interval=None):
@@ -144,12 +283,13 @@ class ActionAutomator:
             key: 按鍵（可以是字符串或 Key 對象）
             interval: 操作後的等待時間（秒），如果為 None 則使用預設間隔
         """
-        if self.should_stop:
+        if self._stop_event.is_set():
             return
-        self.keyboard_controller.press(key)
-        self.keyboard_controller.release(key)
-        key_name = key if isinstance(key, str) else str(key).replace('Key.', '')
-        print(f"按下: {key_name}")
+        self._kb_press(key)
+        self._kb_release(key)
+        if log.isEnabledFor(logging.DEBUG):
+            key_name = key if isinstance(key, str) else str(key).replace('Key.', '')
+            log.debug("按下: %s", key_name)
         self.wait(interval)
     
     def save_clipboard_to_file(self, filepath):
@@ -159,23 +299,45 @@ class ActionAutomator:
         Args:
             filepath: 檔案路徑
         """
+        if self._stop_event.is_set():
+            return
         try:
-            clipboard_content = pyperclip.paste()
-            file_path = Path(filepath)
+            clipboard_content = _clipboard.paste()
+            self._last_clip = clipboard_content
+            file_path = filepath if isinstance(filepath, Path) else Path(filepath)
+            # write_text 返回時檔案已關閉，後續讀取可立即看到完整內容，不需額外等待
             file_path.write_text(clipboard_content, encoding='utf-8')
             print(f"✓ 已將剪貼簿內容儲存到: {file_path.absolute()}")
-            self.wait(0.3)  # 稍等一下確保檔案寫入完成
         except Exception as e:
             print(f"✗ 儲存檔案時發生錯誤: {e}")
             raise
     
-    def run_script(self, script_path):
+    def _run_parse_questions(self):
+        """
+        在目前程序中執行 parse_questions.main()
+        
+        Returns:
+            返回碼（0 表示成功）
+        """
+        try:
+            parse_questions.main([])
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else 1
+        except Exception:
+            traceback.print_exc()
+            return 1
+        return 0
+    
+    def run_script(self, script_path, verbose=False):
         """
         執行 Python 腳本
         
         Args:
             script_path: 腳本路徑
+            verbose: 是否擷取並顯示以子程序執行之腳本的輸出（預設捨棄輸出）
         """
+        if self._stop_event.is_set():
+            return
         try:
             script_path = Path(script_path)
             if not script_path.exists():
@@ -183,40 +345,74 @@ class ActionAutomator:
                 return
             
             print(f"執行腳本: {script_path}")
-            result = subprocess.run(
-                ['python3', str(script_path)],
-                capture_output=True,
-                text=True,
-                encoding='utf-8'
-            )
-            
-            if result.stdout:
-                print(result.stdout)
-            if result.stderr:
-                print(result.stderr)
+            if script_path.stem == 'parse_questions' and parse_questions is not None:
+                returncode = self._run_parse_questions()
+            else:
+                # 不寫入 .pyc，並關閉輸出緩衝讓輸出能即時讀完
+                env = {**os.environ, 'PYTHONDONTWRITEBYTECODE': '1', 'PYTHONUNBUFFERED': '1'}
+                if verbose:
+                    result = subprocess.run(
+                        ['python3', str(script_path)],
+                        capture_output=True,
+                        text=True,
+                        encoding='utf-8',
+                        env=env
+                    )
+                    
+                    if result.stdout:
+                        print(result.stdout)
+                    if result.stderr:
+                        print(result.stderr)
+                else:
+                    # 不需要輸出時直接導向 DEVNULL，省去建立管線與解碼
+                    result = subprocess.run(
+                        ['python3', str(script_path)],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        check=False,
+                        env=env
+                    )
+                returncode = result.returncode
             
-            if result.returncode == 0:
+            if returncode == 0:
                 print(f"✓ 腳本執行成功")
             else:
-                print(f"✗ 腳本執行失敗，返回碼: {result.returncode}")
+                print(f"✗ 腳本執行失敗，返回碼: {returncode}")
             
             self.wait(0.5)
         except Exception as e:
             print(f"✗ 執行腳本時發生錯誤: {e}")
             raise
     
+    def _run_step(self, step):
+        """
+        執行操作序列中的單一步驟
+        
+        Args:
+            step: AUTOMATION_SCRIPT 中的一筆 (操作類型, 參數...) tuple
+        """
+        kind = step[0]
+        if kind == 'click':
+            self.click(step[1], step[2], interval=step[3])
+        elif kind == 'combo':
+            self.press_key_combination(self._MODIFIER_KEY, step[1], interval=step[2])
+        elif kind == 'paste':
+            self.paste_text(step[1], interval=step[2])
+        elif kind == 'key':
+            self.press_key(step[1], interval=step[2])
+        elif kind == 'save':
+            print(f"\n[步驟] 將剪貼簿內容儲存為 {step[1]}")
+            self.save_clipboard_to_file(step[1])
+        elif kind == 'run':
+            print(f"\n[步驟] 執行 {step[1]}")
+            self.run_script(step[1])
+        else:
+            raise ValueError(f"未知的操作類型: {kind}")
+    
     def run_automation(self):
         """執行自動化操作序列"""
-        # 確保鍵盤監聽器正在運行
-        if self.keyboard_listener is None:
-            self.should_stop = False
-            self.keyboard_listener = KeyboardListener(on_press=self.on_key_press)
-            self.keyboard_listener.start()
-        elif not self.keyboard_listener.is_alive():
-            # 如果監聽器已停止，重新啟動
-            self.should_stop = False
-            self.keyboard_listener = KeyboardListener(on_press=self.on_key_press)
-            self.keyboard_listener.start()
+        # 確保 ESC 鍵監聽執行緒正在運行（已停止則重新啟動）
+        self.start_esc_watcher()
         
         print("=" * 60)
         print("開始執行自動化操作...")
@@ -226,199 +422,56 @@ class ActionAutomator:
         print("按 ESC 鍵可隨時停止")
         print("=" * 60)
         
-        # 點擊位置 1 參賽按鈕
-        # TODO: 請填入座標 (x, y)
-        self.click(100, 175, interval=0.5)
-        if self.should_stop:
-            return
-        
-        # 點擊位置 2 模擬取卷練習
-        # TODO: 請填入座標 (x, y)
-        self.click(300, 750, interval=0.5)
-        if self.should_stop:
-            return
-
-        # 點擊位置 8 空點
-        # TODO: 請填入座標 (x, y)
-        self.click(1100, 400, interval=0.5)
-        if self.should_stop:
-            return
-            
-        # 按 Ctrl+F (Mac: Cmd+F) 搜尋
-        self.press_key_combination(self.modifier_key, 'f', interval=0.5)
-        if self.should_stop:
-            return
-
-        # 按 Ctrl+V (Mac: Cmd+V) 貼上 "01. " 選擇單元 "02. " "03. " "04. " ...
-        self.paste_text("01. ", interval=0.5)
-        if self.should_stop:
-            return
-
-        # 點擊位置 3 播放影片
-        # TODO: 請填入座標 (x, y)
-        self.click(800, 800, interval=0.5)
-        if self.should_stop:
-            return
-        
-        # 點擊位置 4 關閉影片
-        # TODO: 請填入座標 (x, y)
-        self.click(1010, 20, interval=0.5)
-        if self.should_stop:
-            return
-        
-        # 點擊位置 5 打開console
-        # TODO: 請填入座標 (x, y)
-        self.click(1240, 200, interval=0.5)
-        if self.should_stop:
-            return
-        
-        # 按 Ctrl+V (Mac: Cmd+V) 貼上
-        paste_content = """const yourAnswers = [
-    1, 3, 2, 4, 1, 3, 2, 4, 1, 3, // 第 1 到 10 題
-    2, 4, 1, 3, 2, 4, 1, 3, 2, 4, // 第 11 到 20 題
-    1, 3, 2, 4, 1, 3, 2, 4, 1, 3, // 第 21 到 30 題
-    2, 4, 1, 3, 2, 4, 1, 3, 2, 4, // 第 31 到 40 題
-    1, 3, 2, 4, 1, 3, 2, 4, 1, 3, // 第 41 到 50 題
-    2, 4, 1, 3, 2, 4, 1, 3,        // 第 51 到 58 題
-    2, 4, 1, 3, 2, 4             // 第 59 到 64 題
-];
-
-const allQuestionContainers = document.querySelectorAll('.body');
-
-if (allQuestionContainers.length < yourAnswers.length) {
-    console.error(`❌ 錯誤：答案數量 (${yourAnswers.length}) 多於頁面上的題目數量 (${allQuestionContainers.length})。`);
-}
-
-yourAnswers.forEach((answerValue, index) => {
-    const questionIndex = index + 1; // 題目從 1 開始
-    const container = allQuestionContainers[index];
-
-    if (!container) {
-        console.warn(`⚠️ 警告：找不到第 ${questionIndex} 題的容器。`);
-        return;
-    }
-
-    const targetRadio = container.querySelector(`input[type="radio"][value="${answerValue}"]`);
-
-    if (targetRadio) {
-        targetRadio.checked = true;
-        console.log(`✅ 第 ${questionIndex} 題成功選取選項 (${answerValue})。`);
-    } else {
-        console.warn(`⚠️ 警告：第 ${questionIndex} 題找不到對應選項 (${answerValue})。`);
-    }
-});"""
-        self.paste_text(paste_content, interval=0.5)
-        if self.should_stop:
-            return
-        
-        # 按下 Enter
-        self.press_key(Key.enter, interval=1)
-        if self.should_stop:
-            return
-
-        # 點擊位置 6 交卷
-        # TODO: 請填入座標 (x, y)
-        self.click(980, 650, interval=1)
-        if self.should_stop:
-            return
-        
-        # 點擊位置 7 進入element
-        # TODO: 請填入座標 (x, y)
-        self.click(1170, 200, interval=0.5)
-        if self.should_stop:
-            return
-        
-        # 點擊位置 8 空點
-        # TODO: 請填入座標 (x, y)
-        self.click(1100, 400, interval=0.5)
-        if self.should_stop:
-            return
-
-        # 按 Ctrl+F (Mac: Cmd+F) 搜尋
-        self.press_key_combination(self.modifier_key, 'f', interval=0.5)
-        if self.should_stop:
-            return
-
-        # 按 Ctrl+V (Mac: Cmd+V) 貼上 "tbody"
-        self.paste_text("tbody", interval=0.5)
-        if self.should_stop:
-            return
-
-        # 點擊位置 8 點選需複製的內容
-        # TODO: 請填入座標 (x, y)
-        self.click(1300, 445, interval=0.5)
-        if self.should_stop:
-            return
-        
-        # 按 Ctrl+C (Mac: Cmd+C) 複製
-        self.press_key_combination(self.modifier_key, 'c', interval=0.5)
-        if self.should_stop:
-            return
-        
-        # 將剪貼簿內容儲存為 questions.html
-        print("\n[步驟] 將剪貼簿內容儲存為 questions.html")
-        self.save_clipboard_to_file('questions.html')
-        if self.should_stop:
-            return
-        
-        # 執行 parse_questions.py
-        print("\n[步驟] 執行 parse_questions.py")
-        self.run_script('parse_questions.py')
-        if self.should_stop:
-            return
-        
-        # 按 Ctrl+F (Mac: Cmd+F) 搜尋
-        self.press_key_combination(self.modifier_key, 'f', interval=0.5)
-        if self.should_stop:
-            return
-
-        # 按 Ctrl+V (Mac: Cmd+V) 貼上 "active" 回到最上面
-        self.paste_text("active", interval=0.5)
-        if self.should_stop:
-            return
+        for step in AUTOMATION_SCRIPT:
+            self._run_step(step)
+            if self._esc_checks and self._stop_event.is_set():
+                return
 
         print("\n" + "=" * 60)
         print("✓ 自動化操作執行完成！")
         print("=" * 60)
     
-    def run_loop(self):
-        """循環執行自動化操作，直到按下 ESC 鍵"""
+    def run_loop(self, loop_interval=2.0):
+        """
+        循環執行自動化操作，直到按下 ESC 鍵
+        
+        Args:
+            loop_interval: 每次循環之間的等待時間（秒）
+        """
         print("\n" + "=" * 60)
         print("開始循環執行自動化操作...")
         print("按 ESC 鍵可停止循環")
         print("=" * 60)
         
-        # 啟動 ESC 鍵監聽器
-        self.should_stop = False
-        self.keyboard_listener = KeyboardListener(on_press=self.on_key_press)
-        self.keyboard_listener.start()
+        # 啟動 ESC 鍵監聽執行緒
+        self.start_esc_watcher()
         
         loop_count = 0
-        while not self.should_stop:
+        while not self._stop_event.is_set():
             loop_count += 1
             print(f"\n{'=' * 60}")
             print(f"開始第 {loop_count} 次循環")
             print(f"{'=' * 60}")
             
             # 執行完整的自動化流程
+            cycle_start = time.perf_counter()
             self.run_automation()
+            print(f"本次循環耗時 {time.perf_counter() - cycle_start:.2f} 秒")
             
             # 檢查是否收到停止信號
-            if self.should_stop:
+            if self._stop_event.is_set():
                 print("\n收到停止信號，退出循環")
                 break
             
-            # 等待 2 秒後再次執行
-            print(f"\n等待 2 秒後開始第 {loop_count + 1} 次循環...")
+            # 等待一段時間後再次執行
+            print(f"\n等待 {loop_interval} 秒後開始第 {loop_count + 1} 次循環...")
             print("（按 ESC 鍵可停止）")
-            for i in range(20):  # 2秒 = 20 * 0.1秒，每0.1秒檢查一次
-                if self.should_stop:
-                    break
-                time.sleep(0.1)
+            if self.wait(loop_interval):
+                print("\n收到停止信號，退出循環")
         
-        # 停止鍵盤監聽器
-        if self.keyboard_listener:
-            self.keyboard_listener.stop()
+        # 停止 ESC 鍵監聽器
+        if self._esc_listener is not None:
+            self._esc_listener.stop()
         
         print("\n" + "=" * 60)
         print(f"✓ 循環執行完成！共執行 {loop_count} 次")
@@ -426,6 +479,12 @@ yourAnswers.forEach((answerValue, index) => {
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='滑鼠鍵盤自動化腳本')
+    parser.add_argument('-v', '--verbose', action='store_true', help='顯示每個滑鼠/鍵盤操作')
+    args = parser.parse_args()
+    # 預設只顯示警告以上的訊息，個別操作的紀錄不會被格式化與輸出
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING, format='%(message)s')
+    
     # 建立自動化執行器，設定操作間隔為 0.5 秒
     # 可以調整 action_interval 參數來改變操作間隔
     automator = ActionAutomator(action_interval=0.5)
@@ -435,18 +494,16 @@ if __name__ == '__main__':
         print("\n將在 3 秒後開始執行...")
         print("請確保目標應用程式已開啟並準備好")
         print("腳本將循環執行，按 ESC 鍵可停止")
-        time.sleep(3)
-        
-        # 循環執行自動化操作
-        automator.run_loop()
+        # 先啟動 ESC 鍵監聽，準備時間內按下 ESC 即可直接取消
+        automator.start_esc_watcher()
+        if automator._stop_event.wait(3.0):
+            print("\n已在開始前取消執行")
+        else:
+            # 循環執行自動化操作
+            automator.run_loop()
     except KeyboardInterrupt:
         print("\n\n操作已取消")
-        if automator.keyboard_listener:
-            automator.keyboard_listener.stop()
     except Exception as e:
         print(f"\n\n發生錯誤: {e}")
-        import traceback
         traceback.print_exc()
-        if automator.keyboard_listener:
-            automator.keyboard_listener.stop()
 
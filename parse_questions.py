@@ -13,18 +13,30 @@ parse_questions.py
 若 HTML 中有 <span style="color:red;">正確答案為:X</span> 以此為主；
 若沒有，則會從第二個 <td>（通常為答案欄）抓數字作為答案。
 
-需要套件：beautifulsoup4, lxml
+需要套件：lxml（優先直接使用）；未安裝 lxml 時改用 beautifulsoup4，
+兩者皆無時使用正則式簡單解析
 """
 
 from pathlib import Path
+import os
 import re
 import csv
+import string
 import argparse
+from itertools import islice
 try:
-    from bs4 import BeautifulSoup
+    from lxml import etree, html as lxml_html
+    _HAVE_LXML = True
+except Exception:
+    etree = None
+    lxml_html = None
+    _HAVE_LXML = False
+try:
+    from bs4 import BeautifulSoup, SoupStrainer
     _HAVE_BS4 = True
 except Exception:
     BeautifulSoup = None
+    SoupStrainer = None
     _HAVE_BS4 = False
 
 # ========== 使用者設定 ==========
@@ -38,12 +50,240 @@ DEFAULT_INPUT_FILE = 'questions.html'
 DEFAULT_FORMAT = 'csv'
 # ================================
 
+# 輸出 CSV 的欄位名稱
+_COLS = ('題目', '選項1', '選項2', '選項3', '選項4', '答案')
+
+# 正確答案標記文字；先以 in 檢查是否出現，再決定要不要跑正則式
+_ANSWER_MARKER = '正確答案為'
+# 預先編譯的正則式，避免每一列都重新查表/編譯
+_RE_ANSWER_SPAN = re.compile(r'正確答案為')
+_RE_ANSWER_MARK = re.compile(r'正確答案為[:：]?\s*([1-4])')
+_RE_STRIP_ANSWER = re.compile(r'正確答案為[:：]?\s*[1-4]')
+_RE_DIGIT14 = re.compile(r'[1-4]')
+_RE_OPT_START = re.compile(r'\(\s*([1-4])\s*\)')
+# 表頭列的欄位名稱
+_HEADER_KEYS = frozenset(('題號', '答案', '題目'))
+# 正則式 fallback 使用的 HTML 樣式
+# 與 <.*?> 等價（tag 不跨行），但以否定字元類一次吃到 '>'，不需要逐字回溯
+_RE_TAG = re.compile(r'<[^>\n]*>')
+_RE_BR = re.compile(r'<br\s*/?>', re.IGNORECASE)
+_RE_COLSPAN = re.compile(r'colspan\s*=\s*"?\d+"?', re.IGNORECASE)
+# 只轉換 ASCII 大小寫的對照表：str.lower() 會改變長度時（例如 'İ'）的備用方案
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+# get_next_filename 用的檔名正則式快取，key 為 (prefix, file_format)
+_FILENAME_RE_CACHE = {}
+# 只建立 <tr> 的樹，略過表格以外的內容
+_ONLY_TR = SoupStrainer('tr') if _HAVE_BS4 else None
+# lxml 解析器：輸入 HTML 一律以 UTF-8 解碼（剪貼簿存下的片段沒有 charset 宣告）
+_LXML_PARSER = lxml_html.HTMLParser(encoding='utf-8') if _HAVE_LXML else None
+# 預先編譯的 XPath：只取出有 <td> 且第一格沒有 colspan（非表頭）的列
+_XP_QUESTION_ROWS = etree.XPath('//tr[td and not(td[1]/@colspan)]') if _HAVE_LXML else None
+
+
+def _lxml_text(el, separator=''):
+    """
+    取得 lxml 元素的文字，等同 BeautifulSoup 的 get_text(separator, strip=True)
+    """
+    return separator.join(s.strip() for s in el.itertext() if s.strip())
+
+
+def _lxml_string(el):
+    """
+    等同 BeautifulSoup 的 .string：元素只有單一子節點時往下取該節點的文字，
+    否則回傳 None（例如 <span><b>文字</b></span> 會取得「文字」）
+    """
+    while len(el):
+        if len(el) > 1 or el.text or el[0].tail:
+            return None
+        el = el[0]
+    return el.text
+
+
+def _lxml_answer_span(td):
+    """找出儲存格內第一個以文字標示「正確答案為」的 <span>，沒有時回傳 None"""
+    for span in td.iter('span'):
+        text = _lxml_string(span)
+        if text and _ANSWER_MARKER in text:
+            return span
+    return None
+
+
+def _find_elements(lowered, tag, start, end):
+    """
+    在 lowered[start:end] 中依序找出 <tag ...>內容</tag>，不使用正則式回溯
+
+    Args:
+        lowered: 已轉為小寫的 HTML（用來做不分大小寫的搜尋）
+        tag: 小寫的 tag 名稱（例如 'tr'）
+        start, end: 搜尋範圍
+
+    Returns:
+        每個元素內容的 (起點, 終點) 列表
+    """
+    open_tag = '<' + tag
+    close_tag = '</' + tag + '>'
+    spans = []
+    i = start
+    while True:
+        i = lowered.find(open_tag, i, end)
+        if i < 0:
+            break
+        content_start = lowered.find('>', i, end) + 1
+        if not content_start:
+            break
+        content_end = lowered.find(close_tag, content_start, end)
+        if content_end < 0:
+            break
+        spans.append((content_start, content_end))
+        i = content_end + len(close_tag)
+    return spans
+
+
+def _iter_rows(html_text):
+    """
+    以 str.find 掃描 HTML，依序產生每個 <tr> 的 (內部 HTML, [各 <td> 的內部 HTML])
+    """
+    # 小寫副本的索引必須與原字串一一對應
+    lowered = html_text.lower()
+    if len(lowered) != len(html_text):
+        lowered = html_text.translate(_ASCII_LOWER)
+    for tr_start, tr_end in _find_elements(lowered, 'tr', 0, len(lowered)):
+        tds = [html_text[a:b] for a, b in _find_elements(lowered, 'td', tr_start, tr_end)]
+        yield html_text[tr_start:tr_end], tds
+
+
+def _strip_tags(s):
+    """移除 HTML tag 並去除前後空白"""
+    if '<' not in s:
+        return s.strip()
+    return _RE_TAG.sub('', s).strip()
+
+
+def _norm_ws(s):
+    """將連續空白合併為單一空格並去除前後空白（str.split 以 C 實作，不經過正則式）"""
+    return ' '.join(s.split())
+
+
+def _build_row(q_text, answer_index):
+    """
+    由題目文字（已移除正確答案標記）切出題目與四個選項，並依答案編號取得答案文字
+    
+    Args:
+        q_text: 題目與選項的純文字（以換行分隔）
+        answer_index: 正確答案編號（1-4），無法判斷時為 None
+    
+    Returns:
+        (題目, 選項1, 選項2, 選項3, 選項4, 答案)
+    """
+    # 單次掃描選項標記 (1) ... (2) ... (3) ... (4)：
+    # 遇到下一個標記時才切出上一個選項，不另外建立標記列表
+    options = ["", "", "", ""]
+    title_end = None
+    prev_end = prev_idx = None
+    # 沒有半形括號就不可能有選項標記，直接略過正則式掃描
+    markers = _RE_OPT_START.finditer(q_text) if '(' in q_text else ()
+    for m in markers:
+        if prev_idx is None:
+            title_end = m.start()
+        else:
+            options[prev_idx] = _norm_ws(q_text[prev_end:m.start()])
+        prev_end, prev_idx = m.end(), int(m.group(1)) - 1
+
+    if prev_idx is not None:
+        # 最後一個選項延伸到字串結尾
+        options[prev_idx] = _norm_ws(q_text[prev_end:])
+        q_title = _norm_ws(q_text[:title_end])
+    else:
+        # 只需要前 5 個非空行（題目 + 四個選項），不必建立整份列表
+        lines = (ln.strip() for ln in q_text.splitlines())
+        parts = list(islice((ln for ln in lines if ln), 5))
+        if len(parts) == 5:
+            q_title = parts[0]
+            options[:] = parts[1:]
+        else:
+            q_title = q_text
+
+    answer_text = ''
+    if answer_index and 1 <= answer_index <= 4:
+        answer_text = options[answer_index-1]
+
+    return (q_title, options[0], options[1], options[2], options[3], answer_text)
+
 
 def extract_questions_from_html(html_text):
+    """
+    從題庫 HTML 解析出所有題目
+    
+    Args:
+        html_text: HTML 內容（bytes 或 str；bytes 以 UTF-8 解碼）
+    
+    Returns:
+        (題目, 選項1, 選項2, 選項3, 選項4, 答案) 的列表
+    """
     results = []
+    # 迴圈中直接呼叫區域變數，省去每列一次屬性查找
+    results_append = results.append
+    is_bytes = isinstance(html_text, bytes)
+    # 空的或只有空白的輸入（例如剪貼簿是空的）直接視為沒有題目
+    if not html_text.strip():
+        return results
+
+    if _HAVE_LXML:
+        # 直接使用 lxml（C 實作）走訪，不經過 BeautifulSoup 的 Python 物件包裝；
+        # bytes 直接交給 libxml2 解碼，不先在 Python 轉成 str
+        try:
+            root = lxml_html.document_fromstring(html_text, parser=_LXML_PARSER)
+        except etree.ParserError:
+            # 只有註解等沒有任何元素的輸入，同樣視為沒有題目
+            return results
+        # 沒有 <td> 或第一格有 colspan（表頭）的列已由 XPath 在 C 層濾掉
+        for tr in _XP_QUESTION_ROWS(root):
+            tds = tr.findall('td')
 
-    if _HAVE_BS4:
-        soup = BeautifulSoup(html_text, 'lxml')
+            # we expect at least 3 tds: 題號 | 答案欄 | 題目(含選項)
+            if len(tds) < 3:
+                continue
+
+            # skip header row if it contains column titles like '題號','答案','題目'
+            # （依序比對，前面的格子命中時就不再取後面格子的文字）
+            if (_lxml_text(tds[0]) in _HEADER_KEYS
+                    or _lxml_text(tds[1]) in _HEADER_KEYS
+                    or _lxml_text(tds[2]) in _HEADER_KEYS):
+                continue
+
+            td_answer_cell = tds[1]
+            td_question_cell = tds[2]
+
+            # 取得題目與選項的純文字（使用換行分隔）；
+            # 文字中沒有「正確答案為」時不可能有紅色標記，略過 span 搜尋
+            q_text = _lxml_text(td_question_cell, '\n')
+            has_marker = _ANSWER_MARKER in q_text
+
+            # 先嘗試在題目cell找紅色正確答案標記
+            answer_index = None
+            span = _lxml_answer_span(td_question_cell) if has_marker else None
+            if span is not None:
+                m = _RE_ANSWER_MARK.search(span.text_content())
+                if m:
+                    answer_index = int(m.group(1))
+
+            # 若題目cell無紅色標記，則嘗試從答案欄抓數字
+            if answer_index is None:
+                m2 = _RE_DIGIT14.search(td_answer_cell.text_content())
+                if m2:
+                    answer_index = int(m2.group())
+
+            # 移除「正確答案為:X」
+            if has_marker:
+                q_text = _RE_STRIP_ANSWER.sub('', q_text)
+
+            results_append(_build_row(q_text, answer_index))
+
+    elif _HAVE_BS4:
+        # 沒有 lxml 時使用 Python 內建的 html.parser；
+        # bytes 直接交給 BeautifulSoup 並指定 UTF-8，省去編碼偵測
+        soup = BeautifulSoup(html_text, 'html.parser', parse_only=_ONLY_TR,
+                             from_encoding='utf-8' if is_bytes else None)
         rows = soup.find_all('tr')
         for tr in rows:
             # skip header rows or rows that are not question rows
@@ -56,152 +296,148 @@ def extract_questions_from_html(html_text):
             if first_td.has_attr('colspan'):
                 continue
 
-            # skip header row if it contains column titles like '題號','答案','題目'
-            first_text = tds[0].get_text(strip=True)
-            second_text = tds[1].get_text(strip=True) if len(tds) > 1 else ''
-            third_text = tds[2].get_text(strip=True) if len(tds) > 2 else ''
-            header_keys = {'題號', '答案', '題目'}
-            if any(key in (first_text, second_text, third_text) for key in header_keys):
-                continue
-
             # we expect at least 3 tds: 題號 | 答案欄 | 題目(含選項)
             if len(tds) < 3:
                 continue
 
+            # skip header row if it contains column titles like '題號','答案','題目'
+            # （依序比對，前面的格子命中時就不再取後面格子的文字）
+            if (tds[0].get_text(strip=True) in _HEADER_KEYS
+                    or tds[1].get_text(strip=True) in _HEADER_KEYS
+                    or tds[2].get_text(strip=True) in _HEADER_KEYS):
+                continue
+
             td_answer_cell = tds[1]
             td_question_cell = tds[2]
 
+            # 取得題目與選項的純文字（使用換行分隔）；
+            # 文字中沒有「正確答案為」時不可能有紅色標記，略過走訪子孫 span
+            q_text = td_question_cell.get_text(separator='\n', strip=True)
+            has_marker = _ANSWER_MARKER in q_text
+
             # 先嘗試在題目cell找紅色正確答案標記
-            span = td_question_cell.find('span', string=re.compile(r'正確答案為'))
+            span = td_question_cell.find('span', string=_RE_ANSWER_SPAN) if has_marker else None
             answer_index = None
             if span:
-                m = re.search(r'正確答案為[:：]?\s*([1-4])', span.get_text())
+                m = _RE_ANSWER_MARK.search(span.get_text())
                 if m:
                     answer_index = int(m.group(1))
 
             # 若題目cell無紅色標記，則嘗試從答案欄抓數字
             if answer_index is None:
                 txt = td_answer_cell.get_text(strip=True)
-                m2 = re.search(r'([1-4])', txt)
+                m2 = _RE_DIGIT14.search(txt)
                 if m2:
-                    answer_index = int(m2.group(1))
-
-            # 取得題目與選項的純文字（使用換行分隔）
-            q_text = td_question_cell.get_text(separator='\n', strip=True)
+                    answer_index = int(m2.group())
 
             # 移除可能出現的「正確答案為:X」從題目文字中
-            q_text = re.sub(r'正確答案為[:：]?\s*[1-4]', '', q_text)
-
-            # 找出所有選項標記 (1) ... (2) ... (3) ... (4)
-            option_starts = list(re.finditer(r'\(\s*([1-4])\s*\)', q_text))
-
-            options = ["", "", "", ""]
-            if option_starts:
-                for i, m in enumerate(option_starts):
-                    idx = int(m.group(1)) - 1
-                    start = m.end()
-                    end = option_starts[i+1].start() if i+1 < len(option_starts) else len(q_text)
-                    opt = q_text[start:end].strip()
-                    opt = re.sub(r'\s+', ' ', opt).strip()
-                    options[idx] = opt
-
-                q_title = q_text[:option_starts[0].start()].strip()
-                q_title = re.sub(r'\s+', ' ', q_title)
-            else:
-                parts = [p.strip() for p in q_text.splitlines() if p.strip()]
-                if len(parts) >= 5:
-                    q_title = parts[0]
-                    for i in range(4):
-                        options[i] = parts[i+1]
-                else:
-                    q_title = q_text
-
-            answer_text = ''
-            if answer_index and 1 <= answer_index <= 4:
-                answer_text = options[answer_index-1]
-
-            results.append((q_title, options[0], options[1], options[2], options[3], answer_text))
+            if has_marker:
+                q_text = _RE_STRIP_ANSWER.sub('', q_text)
+
+            results_append(_build_row(q_text, answer_index))
 
     else:
-        # Fallback: 不依賴 BeautifulSoup，使用正則式簡單解析（適用於結構規則的 table）
-        trs = re.findall(r'<tr[^>]*>(.*?)</tr>', html_text, flags=re.DOTALL | re.IGNORECASE)
-        for tr in trs:
-            tds = re.findall(r'<td[^>]*>(.*?)</td>', tr, flags=re.DOTALL | re.IGNORECASE)
+        # Fallback: 不依賴 lxml/BeautifulSoup，以字串掃描簡單解析（適用於結構規則的 table）
+        # 只有這個分支需要 str；無法解碼的位元組以替代字元取代，不中斷解析
+        if is_bytes:
+            html_text = html_text.decode('utf-8', errors='replace')
+        for tr, tds in _iter_rows(html_text):
             if not tds:
                 continue
             # 跳過 header (含 colspan)
-            first_td_raw = tds[0]
-            if re.search(r'colspan\s*=\s*"?\d+"?', tr, flags=re.IGNORECASE):
-                continue
-            # 跳過 header row 若為標題列（包含 題號, 答案, 題目）
-            # 先去掉 HTML tag，再比對文字
-            def strip_tags(s):
-                return re.sub(r'<.*?>', '', s).strip()
-            first_text = strip_tags(tds[0])
-            second_text = strip_tags(tds[1]) if len(tds) > 1 else ''
-            third_text = strip_tags(tds[2]) if len(tds) > 2 else ''
-            header_keys = {'題號', '答案', '題目'}
-            if any(key in (first_text, second_text, third_text) for key in header_keys):
+            if _RE_COLSPAN.search(tr):
                 continue
             if len(tds) < 3:
                 continue
+            # 跳過 header row 若為標題列（包含 題號, 答案, 題目）
+            # 先去掉 HTML tag，再依序比對文字（前面命中就不處理後面的格子）
+            if (_strip_tags(tds[0]) in _HEADER_KEYS
+                    or _strip_tags(tds[1]) in _HEADER_KEYS
+                    or _strip_tags(tds[2]) in _HEADER_KEYS):
+                continue
 
             td_answer_html = tds[1]
             td_question_html = tds[2]
 
             # 把 <br> 轉為換行，移除其他 tag
-            td_answer_text = re.sub(r'<br\s*/?>', '\n', td_answer_html, flags=re.IGNORECASE)
-            td_answer_text = re.sub(r'<.*?>', '', td_answer_text).strip()
-
-            td_question_text = re.sub(r'<br\s*/?>', '\n', td_question_html, flags=re.IGNORECASE)
-            td_question_text = re.sub(r'<.*?>', '', td_question_text).strip()
+            td_question_text = _strip_tags(_RE_BR.sub('\n', td_question_html))
+            has_marker = _ANSWER_MARKER in td_question_text
 
             # 先找題目內的正確答案標示
             answer_index = None
-            m = re.search(r'正確答案為[:：]?\s*([1-4])', td_question_text)
+            m = _RE_ANSWER_MARK.search(td_question_text) if has_marker else None
             if m:
                 answer_index = int(m.group(1))
 
+            # 題目內沒有標示時才處理答案欄
             if answer_index is None:
-                m2 = re.search(r'([1-4])', td_answer_text)
+                td_answer_text = _strip_tags(_RE_BR.sub('\n', td_answer_html))
+                m2 = _RE_DIGIT14.search(td_answer_text)
                 if m2:
-                    answer_index = int(m2.group(1))
-
-            q_text = re.sub(r'正確答案為[:：]?\s*[1-4]', '', td_question_text).strip()
-
-            option_starts = list(re.finditer(r'\(\s*([1-4])\s*\)', q_text))
-            options = ["", "", "", ""]
-            if option_starts:
-                for i, m in enumerate(option_starts):
-                    idx = int(m.group(1)) - 1
-                    start = m.end()
-                    end = option_starts[i+1].start() if i+1 < len(option_starts) else len(q_text)
-                    opt = q_text[start:end].strip()
-                    opt = re.sub(r'\s+', ' ', opt).strip()
-                    options[idx] = opt
-                q_title = q_text[:option_starts[0].start()].strip()
-                q_title = re.sub(r'\s+', ' ', q_title)
-            else:
-                parts = [p.strip() for p in q_text.splitlines() if p.strip()]
-                if len(parts) >= 5:
-                    q_title = parts[0]
-                    for i in range(4):
-                        options[i] = parts[i+1]
-                else:
-                    q_title = q_text
-
-            answer_text = ''
-            if answer_index and 1 <= answer_index <= 4:
-                answer_text = options[answer_index-1]
-
-            results.append((q_title, options[0], options[1], options[2], options[3], answer_text))
+                    answer_index = int(m2.group())
+
+            q_text = td_question_text
+            if has_marker:
+                q_text = _RE_STRIP_ANSWER.sub('', q_text).strip()
+
+            results_append(_build_row(q_text, answer_index))
 
     return results
 
 
+def _filename_regex(prefix, file_format):
+    """取得（並快取）比對「前綴 + 編號 + 副檔名」的正則式"""
+    key = (prefix, file_format)
+    regex = _FILENAME_RE_CACHE.get(key)
+    if regex is None:
+        regex = re.compile(rf'^{re.escape(prefix)}(\d+)\.{re.escape(file_format)}$')
+        _FILENAME_RE_CACHE[key] = regex
+    return regex
+
+
+def _scan_max_index(output_path, prefix, file_format):
+    """
+    掃描資料夾中符合前綴的檔案，回傳目前最大的編號（沒有時為 0）
+    """
+    regex = _filename_regex(prefix, file_format)
+    max_num = 0
+    for file in output_path.glob(f"{prefix}*.{file_format}"):
+        # 從檔案名稱中提取數字（例如：1_1.csv -> 1）
+        match = regex.match(file.name)
+        if match:
+            max_num = max(max_num, int(match.group(1)))
+    return max_num
+
+
+def _index_path(output_path, prefix):
+    """記錄上次使用編號的索引檔路徑"""
+    return output_path / f".{prefix}.idx"
+
+
+def save_filename_index(output_path, prefix, file_format='csv'):
+    """
+    將已成功寫出的自動編號檔案的編號記錄到索引檔，供下次 get_next_filename 使用
+    
+    Args:
+        output_path: 剛寫出的檔案路徑（由 get_next_filename 產生）
+        prefix: 檔案前綴（例如 '1_'）
+        file_format: 檔案格式（預設 'csv'）
+    """
+    output_path = Path(output_path)
+    match = _filename_regex(prefix, file_format).match(output_path.name)
+    if not match:
+        return
+    index_path = _index_path(output_path.parent, prefix)
+    # 以暫存檔 + os.replace 原子性地更新索引檔
+    tmp_path = index_path.with_name(index_path.name + '.tmp')
+    tmp_path.write_text(match.group(1), encoding='utf-8')
+    os.replace(tmp_path, index_path)
+
+
 def get_next_filename(prefix, output_dir, file_format='csv'):
     """
     根據前綴和已有檔案，生成下一個檔案名稱
+    （只決定檔名；寫檔成功後再以 save_filename_index 記錄編號）
     
     Args:
         prefix: 檔案前綴（例如 '1_'）
@@ -214,61 +450,67 @@ def get_next_filename(prefix, output_dir, file_format='csv'):
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
     
-    # 找出所有符合前綴的檔案
-    pattern = f"{prefix}*.{file_format}"
-    existing_files = list(output_path.glob(pattern))
-    
-    # 提取編號並找出最大值
-    max_num = 0
-    for file in existing_files:
-        # 從檔案名稱中提取數字（例如：1_1.xlsx -> 1）
-        match = re.search(rf'^{re.escape(prefix)}(\d+)\.{file_format}$', file.name)
-        if match:
-            num = int(match.group(1))
-            max_num = max(max_num, num)
-    
-    # 生成下一個編號
-    next_num = max_num + 1
+    # 先讀取記錄上次編號的索引檔，避免每次都掃描整個資料夾
+    next_num = None
+    try:
+        next_num = int(_index_path(output_path, prefix).read_text(encoding='utf-8')) + 1
+    except (OSError, ValueError):
+        pass
+
+    # 沒有索引檔、內容無效（含負數）或該檔名已被佔用時，才掃描資料夾找出最大編號
+    if (next_num is None or next_num < 1
+            or (output_path / f"{prefix}{next_num}.{file_format}").exists()):
+        next_num = _scan_max_index(output_path, prefix, file_format) + 1
+
     filename = f"{prefix}{next_num}.{file_format}"
     return output_path / filename
 
 
 def write_output(rows, output_path):
     output_path = Path(output_path)
-    cols = ['題目', '選項1', '選項2', '選項3', '選項4', '答案']
     # 使用標準逗號 ',' 分隔的 CSV
-    with output_path.open('w', encoding='utf-8-sig', newline='') as f:
+    # 一次寫入全部資料列，並放大寫入緩衝區以減少系統呼叫
+    with output_path.open('w', encoding='utf-8-sig', newline='', buffering=1 << 20) as f:
         writer = csv.writer(f, delimiter=',')
-        writer.writerow(cols)
-        for r in rows:
-            writer.writerow(r)
+        writer.writerow(_COLS)
+        writer.writerows(rows)
     print(f"✓ 輸出 {len(rows)} 筆到 {output_path.absolute()}")
 
 
-def main():
+def main(argv=None):
+    """
+    命令列進入點，也可由其他腳本直接呼叫
+    
+    Args:
+        argv: 命令列參數列表，為 None 時使用 sys.argv
+    """
     parser = argparse.ArgumentParser(description='解析題庫 HTML 並輸出 CSV')
     parser.add_argument('-i', '--input', help=f'輸入 HTML 檔案（預設: {DEFAULT_INPUT_FILE}）', default=DEFAULT_INPUT_FILE)
     parser.add_argument('-o', '--output', help='輸出檔案（預設: 自動編號）', default=None)
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     html_path = Path(args.input)
     if not html_path.exists():
         print(f"✗ 找不到檔案: {html_path}")
         return
-    html_text = html_path.read_text(encoding='utf-8')
+    html_bytes = html_path.read_bytes()
 
-    rows = extract_questions_from_html(html_text)
+    rows = extract_questions_from_html(html_bytes)
     if not rows:
         print('✗ 未解析到任何題目，請確認輸入格式是否正確')
         return
 
     # 如果沒有指定輸出檔案，使用自動編號
-    if args.output is None:
+    auto_named = args.output is None
+    if auto_named:
         output_path = get_next_filename(FILE_PREFIX, OUTPUT_DIR, DEFAULT_FORMAT)
     else:
         output_path = Path(args.output)
 
     write_output(rows, output_path)
+    # 寫檔成功後才更新索引檔，寫檔失敗時編號不會被用掉
+    if auto_named:
+        save_filename_index(output_path, FILE_PREFIX, DEFAULT_FORMAT)
 
 
 if __name__ == '__main__':
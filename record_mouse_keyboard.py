@@ -6,11 +6,14 @@
 使用說明：
   python3 record_mouse_keyboard.py
   
-  按 ESC 鍵停止記錄，會自動保存到 actions.json
+  按 ESC 鍵停止記錄；操作會即時寫入 actions.json
 """
 
+import sys
 import json
 import time
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -18,72 +21,177 @@ from pynput import mouse, keyboard
 from pynput.mouse import Listener as MouseListener
 from pynput.keyboard import Key, Listener as KeyboardListener
 
+# 滑鼠按鈕與特殊按鍵的顯示名稱（查表一次完成，不用連續 replace）
+_BUTTON_MAP = {
+    'Button.left': '左鍵',
+    'Button.right': '右鍵',
+    'Button.middle': '中鍵',
+}
+_KEY_MAP = {
+    'Key.space': '空白',
+    'Key.enter': 'Enter',
+    'Key.tab': 'Tab',
+    'Key.backspace': 'Backspace',
+    'Key.delete': 'Delete',
+    'Key.esc': 'ESC',
+    'Key.shift': 'Shift',
+    'Key.shift_l': 'Shift_l',
+    'Key.shift_r': 'Shift_r',
+    'Key.ctrl': 'Ctrl',
+    'Key.ctrl_l': 'Ctrl_l',
+    'Key.ctrl_r': 'Ctrl_r',
+    'Key.alt': 'Alt',
+    'Key.alt_l': 'Alt_l',
+    'Key.alt_r': 'Alt_r',
+    'Key.alt_gr': 'Alt_gr',
+    'Key.cmd': 'Cmd',
+    'Key.cmd_l': 'Cmd_l',
+    'Key.cmd_r': 'Cmd_r',
+}
+
+# 背景輸出執行緒每批最多處理的訊息數
+_LOG_BATCH = 32
+
+
+def _format_log(item):
+    """將輸出佇列中的一筆項目格式化為一行文字"""
+    kind = item[0]
+    if kind == 'click':
+        _, elapsed, x, y, button_str = item
+        button_name = _BUTTON_MAP.get(button_str) or button_str.replace('Button.', '', 1)
+        return f"[{elapsed:.3f}s] 點擊: ({x}, {y}) - {button_name}\n"
+    if kind == 'key':
+        _, elapsed, key_str, special = item
+        # 美化特殊按鍵顯示；表中沒有的按鍵只去掉 'Key.' 前綴
+        key_display = (_KEY_MAP.get(key_str) or key_str.replace('Key.', '', 1)) if special else key_str
+        return f"[{elapsed:.3f}s] 按鍵: {key_display}\n"
+    return f"{item[1]}\n"
+
 
 class ActionRecorder:
     """記錄滑鼠點擊位置和鍵盤按鍵"""
     
     def __init__(self):
-        self.actions = []
         self.start_time = None
+        # 單調時鐘起點，用來計算各操作的經過時間（不受系統校時影響）
+        self._start_pc = None
         self.mouse_listener = None
         self.keyboard_listener = None
         self.recording = False
+        # 記錄邊發生邊寫入檔案，不在記憶體中累積整份列表
+        self.output_path = None
+        self.action_count = 0
+        self._fh = None
+        self._sep = '\n'
+        # 滑鼠與鍵盤監聽器在不同執行緒呼叫回呼，寫檔時需上鎖
+        self._lock = threading.Lock()
+        # 畫面輸出交給背景執行緒，監聽器回呼不必等待 print 與 flush
+        self._logq = queue.Queue()
+        threading.Thread(target=self._log_worker, daemon=True).start()
+    
+    def _log_worker(self):
+        """背景執行緒：從佇列批次取出訊息，格式化後一次寫到 stdout"""
+        get = self._logq.get
+        get_nowait = self._logq.get_nowait
+        while True:
+            batch = [get()]
+            try:
+                while len(batch) < _LOG_BATCH:
+                    batch.append(get_nowait())
+            except queue.Empty:
+                pass
+            try:
+                sys.stdout.write(''.join(map(_format_log, batch)))
+                sys.stdout.flush()
+            except Exception:
+                # 輸出失敗（例如主控台編碼無法顯示中文）只影響畫面顯示，
+                # 記錄仍會寫入檔案；執行緒必須繼續運作，否則 stop_recording 會一直等待
+                pass
+            finally:
+                for _ in batch:
+                    self._logq.task_done()
+    
+    def _write_action(self, action):
+        """
+        將一筆操作以精簡 JSON 寫入檔案（每筆一行，整份檔案仍是合法的 JSON 陣列）；
+        記錄已結束（檔案已關閉）時直接略過
+        
+        Args:
+            action: 操作內容 dict
+        """
+        line = json.dumps(action, ensure_ascii=False, separators=(',', ':'))
+        with self._lock:
+            if self._fh is None:
+                return
+            # 分隔符寫在每筆資料之前，結束時不需要回頭刪除多餘的逗號
+            self._fh.write(self._sep)
+            self._fh.write(line)
+            self._sep = ',\n'
+            # 只計算實際操作（不含開始和結束標記）
+            if action['type'] in ('click', 'key'):
+                self.action_count += 1
     
     def on_click(self, x, y, button, pressed):
         """記錄滑鼠點擊位置"""
         if self.recording and pressed:  # 只記錄按下，不記錄釋放
-            elapsed = time.time() - self.start_time
-            button_name = str(button).replace('Button.', '').replace('left', '左鍵').replace('right', '右鍵').replace('middle', '中鍵')
-            self.actions.append({
+            elapsed = time.perf_counter() - self._start_pc
+            button_str = str(button)
+            self._write_action({
                 'type': 'click',
                 'x': x,
                 'y': y,
-                'button': str(button),
+                'button': button_str,
                 'time': elapsed
             })
-            print(f"[{elapsed:.3f}s] 點擊: ({x}, {y}) - {button_name}")
+            self._logq.put_nowait(('click', elapsed, x, y, button_str))
     
     def on_press(self, key):
         """記錄鍵盤按鍵"""
         if self.recording:
-            elapsed = time.time() - self.start_time
+            elapsed = time.perf_counter() - self._start_pc
             try:
                 key_str = key.char
-                key_display = key_str
+                special = False
             except AttributeError:
                 key_str = str(key)
-                # 美化特殊按鍵顯示
-                key_display = key_str.replace('Key.', '').replace('space', '空白').replace('enter', 'Enter').replace('tab', 'Tab')
-                key_display = key_display.replace('backspace', 'Backspace').replace('delete', 'Delete')
-                key_display = key_display.replace('esc', 'ESC').replace('shift', 'Shift').replace('ctrl', 'Ctrl')
-                key_display = key_display.replace('alt', 'Alt').replace('cmd', 'Cmd')
+                special = True
             
-            self.actions.append({
+            self._write_action({
                 'type': 'key',
                 'key': key_str,
                 'time': elapsed
             })
             
-            print(f"[{elapsed:.3f}s] 按鍵: {key_display}")
+            self._logq.put_nowait(('key', elapsed, key_str, special))
             
             # ESC 鍵停止記錄
             if key == Key.esc:
-                print("\n✓ 停止記錄（按了 ESC 鍵）")
+                self._logq.put_nowait(('msg', "\n✓ 停止記錄（按了 ESC 鍵）"))
                 return False
     
-    def start_recording(self):
-        """開始記錄"""
+    def start_recording(self, filepath='actions.json'):
+        """
+        開始記錄，操作會即時寫入檔案
+        
+        Args:
+            filepath: 輸出 JSON 檔案路徑
+        """
         print("=" * 60)
         print("開始記錄滑鼠點擊位置和鍵盤按鍵...")
         print("按 ESC 鍵停止記錄")
         print("=" * 60)
         
-        self.actions = []
+        self.output_path = Path(filepath)
+        self._fh = self.output_path.open('w', encoding='utf-8', buffering=65536)
+        self._fh.write('[')
+        self._sep = '\n'
+        self.action_count = 0
         self.start_time = time.time()
+        self._start_pc = time.perf_counter()
         self.recording = True
         
         # 記錄開始時間戳
-        self.actions.append({
+        self._write_action({
             'type': 'recording_start',
             'timestamp': datetime.now().isoformat(),
             'time': 0.0
@@ -105,29 +213,29 @@ class ActionRecorder:
         self.stop_recording()
     
     def stop_recording(self):
-        """停止記錄"""
+        """停止記錄並關閉輸出檔案（重複呼叫時不做任何事）"""
         self.recording = False
         if self.mouse_listener:
             self.mouse_listener.stop()
         if self.keyboard_listener:
             self.keyboard_listener.stop()
+        if self._fh is None:
+            return
         
-        elapsed = time.time() - self.start_time if self.start_time else 0
-        self.actions.append({
+        elapsed = time.perf_counter() - self._start_pc if self._start_pc is not None else 0
+        self._write_action({
             'type': 'recording_end',
             'time': elapsed
         })
+        with self._lock:
+            self._fh.write('\n]\n')
+            self._fh.close()
+            self._fh = None
         
-        # 計算實際操作數量（排除開始和結束標記）
-        action_count = len([a for a in self.actions if a['type'] in ('click', 'key')])
-        print(f"\n✓ 記錄完成！共記錄 {action_count} 個操作，總時長 {elapsed:.2f} 秒")
-    
-    def save_to_file(self, filepath='actions.json'):
-        """保存記錄到檔案"""
-        output_path = Path(filepath)
-        with output_path.open('w', encoding='utf-8') as f:
-            json.dump(self.actions, f, indent=2, ensure_ascii=False)
-        print(f"✓ 已保存到：{output_path.absolute()}")
+        # 等背景執行緒輸出完剩下的訊息，確保結果顯示在最後
+        self._logq.join()
+        print(f"\n✓ 記錄完成！共記錄 {self.action_count} 個操作，總時長 {elapsed:.2f} 秒")
+        print(f"✓ 已保存到：{self.output_path.absolute()}")
 
 
 if __name__ == '__main__':
@@ -136,5 +244,3 @@ if __name__ == '__main__':
         recorder.start_recording()
     except KeyboardInterrupt:
         recorder.stop_recording()
-    
-    recorder.save_to_file()